@@ -1,31 +1,51 @@
 import copy
 import warnings
 
+import numpy as np
 from hopp.simulation.hopp_interface import HoppInterface
 from hopp.simulation.technologies.sites import SiteInfo
 
 
+# site entries holding resource data that has already been loaded, which HOPP only reads and
+# which can be large, so they are shared with the original configuration rather than copied
+shared_site_keys = ("solar_resource", "wind_resource", "wave_resource", "tidal_resource")
+
+
+def _clone_hopp_config(hopp_config):
+    """Deep copy ``hopp_config`` so that setting up HOPP does not alter the user's configuration.
+
+    Both this module and HOPP pop and update entries of the technology, site, config, and
+    ``fin_model`` dictionaries. Loaded resource data in the site dictionary is shared with the
+    original configuration instead of being copied.
+    """
+    site = hopp_config.get("site", {})
+    memo = {id(site[key]): site[key] for key in shared_site_keys if site.get(key) is not None}
+    return copy.deepcopy(hopp_config, memo)
+
+
 # Function to set up the HOPP model
-def setup_hopp(hopp_config, plant_config, electrolyzer_rating=None):
-    # overwrite individual fin_model values with cost_info values
-    hopp_config = overwrite_fin_values(hopp_config)
+def setup_hopp(hopp_config, plant_config, electrolyzer_rating=None, overwrite_fin_model=True):
+    # overwrite individual fin_model values with cost_info values, unless the caller already did
+    if overwrite_fin_model:
+        hopp_config = overwrite_fin_values(hopp_config)
+
+    # copy the parts of the config modified below so the caller's config is left unchanged
+    hopp_config_internal = _clone_hopp_config(hopp_config)
 
     # TODO: improve this if logic to correctly account for if the user
     # defines a desired schedule or uses the electrolyzer rating as the desired schedule
-    if "battery" in hopp_config["technologies"].keys() and (
-        "desired_schedule" not in hopp_config["site"].keys()
-        or hopp_config["site"]["desired_schedule"] == []
+    if "battery" in hopp_config_internal["technologies"].keys() and (
+        "desired_schedule" not in hopp_config_internal["site"].keys()
+        or hopp_config_internal["site"]["desired_schedule"] == []
     ):
-        hopp_config["site"]["desired_schedule"] = [10.0] * 8760
+        hopp_config_internal["site"]["desired_schedule"] = [10.0] * 8760
 
     if electrolyzer_rating is not None:
-        hopp_config["site"]["desired_schedule"] = [electrolyzer_rating] * 8760
+        hopp_config_internal["site"]["desired_schedule"] = [electrolyzer_rating] * 8760
 
-    hopp_site = SiteInfo(**hopp_config["site"])
+    hopp_site = SiteInfo(**hopp_config_internal["site"])
 
     # setup hopp interface
-    hopp_config_internal = copy.deepcopy(hopp_config)
-
     if "wave" in hopp_config_internal["technologies"].keys():
         wave_cost_dict = hopp_config_internal["technologies"]["wave"].pop("cost_inputs")
 
@@ -45,38 +65,23 @@ def setup_hopp(hopp_config, plant_config, electrolyzer_rating=None):
 def run_hopp(hi, project_lifetime, verbose=True):
     hi.simulate(project_life=project_lifetime)
 
+    hybrid_plant = hi.system
     capex = 0.0
     opex = 0.0
-    try:
-        solar_capex = hi.system.pv.total_installed_cost
-        solar_opex = hi.system.pv.om_total_expense[0]
-        capex += solar_capex
-        opex += solar_opex
-    except AttributeError:
-        pass
-
-    try:
-        wind_capex = hi.system.wind.total_installed_cost
-        wind_opex = hi.system.wind.om_total_expense[0]
-        capex += wind_capex
-        opex += wind_opex
-    except AttributeError:
-        pass
-
-    try:
-        battery_capex = hi.system.battery.total_installed_cost
-        battery_opex = hi.system.battery.om_total_expense[0]
-        capex += battery_capex
-        opex += battery_opex
-    except AttributeError:
-        pass
+    for tech in ("pv", "wind", "battery"):
+        tech_model = getattr(hybrid_plant, tech, None)
+        if tech_model is not None:
+            capex += tech_model.total_installed_cost
+            opex += tech_model.om_total_expense[0]
 
     grid_outputs = hi.system.grid._system_model.Outputs
     # store results for later use
     hopp_results = {
         "hopp_interface": hi,
         "hybrid_plant": hi.system,
-        "combined_hybrid_power_production_hopp": grid_outputs.system_pre_interconnect_kwac[0:8760],
+        "combined_hybrid_power_production_hopp": np.asarray(
+            grid_outputs.system_pre_interconnect_kwac[0:8760], dtype=np.float64
+        ),
         "combined_hybrid_curtailment_hopp": hi.system.grid.generation_curtailed,
         "energy_shortfall_hopp": hi.system.grid.missed_load,
         "annual_energies": hi.system.annual_energies,
@@ -98,152 +103,31 @@ def run_hopp(hi, project_lifetime, verbose=True):
 
 def overwrite_fin_values(hopp_config):
     # override individual fin_model values with cost_info values
-    if "wind" in hopp_config["technologies"]:
-        if ("wind_om_per_kw" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["wind"]["fin_model"]["system_costs"]["om_capacity"][0]
-            != hopp_config["config"]["cost_info"]["wind_om_per_kw"]
-        ):
-            for i in range(
-                len(hopp_config["technologies"]["wind"]["fin_model"]["system_costs"]["om_capacity"])
-            ):
-                hopp_config["technologies"]["wind"]["fin_model"]["system_costs"]["om_capacity"][
-                    i
-                ] = hopp_config["config"]["cost_info"]["wind_om_per_kw"]
-
-                om_fixed_wind_fin_model = hopp_config["technologies"]["wind"]["fin_model"][
-                    "system_costs"
-                ]["om_capacity"][i]
-                wind_om_per_kw = hopp_config["config"]["cost_info"]["wind_om_per_kw"]
-                msg = (
-                    f"'om_capacity[{i}]' in the wind 'fin_model' was {om_fixed_wind_fin_model},"
-                    f" but 'wind_om_per_kw' in 'cost_info' was {wind_om_per_kw}. The 'om_capacity'"
-                    " value in the wind 'fin_model' is being overwritten with the value from the"
-                    " 'cost_info'"
-                )
-                warnings.warn(msg, UserWarning)
-        if ("wind_om_per_mwh" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["wind"]["fin_model"]["system_costs"]["om_production"][0]
-            != hopp_config["config"]["cost_info"]["wind_om_per_mwh"]
+    for tech in ("wind", "pv", "battery"):
+        if tech not in hopp_config["technologies"]:
+            continue
+        cost_info = hopp_config["config"]["cost_info"]
+        system_costs = hopp_config["technologies"][tech]["fin_model"]["system_costs"]
+        # om_capacity is the capacity-based O&M amount [$/kW], om_production is the
+        # production-based O&M amount [$/MWh]
+        for fin_key, cost_key in (
+            ("om_capacity", f"{tech}_om_per_kw"),
+            ("om_production", f"{tech}_om_per_mwh"),
         ):
-            # Use this to set the Production-based O&M amount [$/MWh]
-            for i in range(
-                len(
-                    hopp_config["technologies"]["wind"]["fin_model"]["system_costs"][
-                        "om_production"
-                    ]
-                )
-            ):
-                hopp_config["technologies"]["wind"]["fin_model"]["system_costs"]["om_production"][
-                    i
-                ] = hopp_config["config"]["cost_info"]["wind_om_per_mwh"]
-            om_wind_variable_cost = hopp_config["technologies"]["wind"]["fin_model"][
-                "system_costs"
-            ]["om_production"][i]
-            wind_om_per_mwh = hopp_config["config"]["cost_info"]["wind_om_per_mwh"]
-            msg = (
-                f"'om_production' in the wind 'fin_model' was {om_wind_variable_cost}, but"
-                f" 'wind_om_per_mwh' in 'cost_info' was {wind_om_per_mwh}. The 'om_production'"
-                " value in the wind 'fin_model' is being overwritten with the value from the"
-                " 'cost_info'"
-            )
-            warnings.warn(msg, UserWarning)
+            if cost_key not in cost_info:
+                continue
+            fin_values = system_costs[fin_key]
+            cost_value = cost_info[cost_key]
+            if fin_values[0] == cost_value:
+                continue
 
-    if "pv" in hopp_config["technologies"]:
-        if ("pv_om_per_kw" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_capacity"][0]
-            != hopp_config["config"]["cost_info"]["pv_om_per_kw"]
-        ):
-            for i in range(
-                len(hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_capacity"])
-            ):
-                hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_capacity"][i] = (
-                    hopp_config["config"]["cost_info"]["pv_om_per_kw"]
-                )
-
-                om_fixed_pv_fin_model = hopp_config["technologies"]["pv"]["fin_model"][
-                    "system_costs"
-                ]["om_capacity"][i]
-                pv_om_per_kw = hopp_config["config"]["cost_info"]["pv_om_per_kw"]
-                msg = (
-                    f"'om_capacity[{i}]' in the pv 'fin_model' was {om_fixed_pv_fin_model}, but"
-                    f" 'pv_om_per_kw' in 'cost_info' was {pv_om_per_kw}. The 'om_capacity' value"
-                    " in the pv 'fin_model' is being overwritten with the value from the"
-                    " 'cost_info'"
-                )
-                warnings.warn(msg, UserWarning)
-        if ("pv_om_per_mwh" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_production"][0]
-            != hopp_config["config"]["cost_info"]["pv_om_per_mwh"]
-        ):
-            # Use this to set the Production-based O&M amount [$/MWh]
-            for i in range(
-                len(hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_production"])
-            ):
-                hopp_config["technologies"]["pv"]["fin_model"]["system_costs"]["om_production"][
-                    i
-                ] = hopp_config["config"]["cost_info"]["pv_om_per_mwh"]
-            om_pv_variable_cost = hopp_config["technologies"]["pv"]["fin_model"]["system_costs"][
-                "om_production"
-            ][i]
-            pv_om_per_mwh = hopp_config["config"]["cost_info"]["pv_om_per_mwh"]
-            msg = (
-                f"'om_production' in the pv 'fin_model' was {om_pv_variable_cost}, but"
-                f" 'pv_om_per_mwh' in 'cost_info' was {pv_om_per_mwh}. The 'om_production' value"
-                " in the pv 'fin_model' is being overwritten with the value from the 'cost_info'"
-            )
-            warnings.warn(msg, UserWarning)
+            fin_value = fin_values[0]
+            fin_values[:] = [cost_value] * len(fin_values)
 
-    if "battery" in hopp_config["technologies"]:
-        if ("battery_om_per_kw" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["battery"]["fin_model"]["system_costs"]["om_capacity"][0]
-            != hopp_config["config"]["cost_info"]["battery_om_per_kw"]
-        ):
-            for i in range(
-                len(
-                    hopp_config["technologies"]["battery"]["fin_model"]["system_costs"][
-                        "om_capacity"
-                    ]
-                )
-            ):
-                hopp_config["technologies"]["battery"]["fin_model"]["system_costs"]["om_capacity"][
-                    i
-                ] = hopp_config["config"]["cost_info"]["battery_om_per_kw"]
-
-            om_batt_fixed_cost = hopp_config["technologies"]["battery"]["fin_model"][
-                "system_costs"
-            ]["om_capacity"][i]
-            battery_om_per_kw = hopp_config["config"]["cost_info"]["battery_om_per_kw"]
-            msg = (
-                f"'om_capacity' in the battery 'fin_model' was {om_batt_fixed_cost}, but"
-                f" 'battery_om_per_kw' in 'cost_info' was {battery_om_per_kw}. The"
-                " 'om_capacity' value in the battery 'fin_model' is being overwritten with the"
-                " value from the 'cost_info'"
-            )
-            warnings.warn(msg, UserWarning)
-        if ("battery_om_per_mwh" in hopp_config["config"]["cost_info"]) and (
-            hopp_config["technologies"]["battery"]["fin_model"]["system_costs"]["om_production"][0]
-            != hopp_config["config"]["cost_info"]["battery_om_per_mwh"]
-        ):
-            # Use this to set the Production-based O&M amount [$/MWh]
-            for i in range(
-                len(
-                    hopp_config["technologies"]["battery"]["fin_model"]["system_costs"][
-                        "om_production"
-                    ]
-                )
-            ):
-                hopp_config["technologies"]["battery"]["fin_model"]["system_costs"][
-                    "om_production"
-                ][i] = hopp_config["config"]["cost_info"]["battery_om_per_mwh"]
-            om_batt_variable_cost = hopp_config["technologies"]["battery"]["fin_model"][
-                "system_costs"
-            ]["om_production"][i]
-            battery_om_per_mwh = hopp_config["config"]["cost_info"]["battery_om_per_mwh"]
             msg = (
-                f"'om_production' in the battery 'fin_model' was {om_batt_variable_cost}, but"
-                f" 'battery_om_per_mwh' in 'cost_info' was {battery_om_per_mwh}. The"
-                " 'om_production' value in the battery 'fin_model' is being overwritten with the"
-                " value from the 'cost_info'",
+                f"'{fin_key}' in the {tech} 'fin_model' was {fin_value}, but '{cost_key}' in"
+                f" 'cost_info' was {cost_value}. The '{fin_key}' value in the {tech} 'fin_model'"
+                " is being overwritten with the value from the 'cost_info'"
             )
             warnings.warn(msg, UserWarning)
 
@@ -1,14 +1,20 @@
+import json
+import pickle
 import hashlib
+import tempfile
+from typing import ClassVar
 from pathlib import Path
+from collections import OrderedDict
 
-import dill
 import numpy as np
 import openmdao.api as om
 
-from h2integrate.converters.hopp.hopp_mgmt import run_hopp, setup_hopp
+from h2integrate.converters.hopp.hopp_mgmt import run_hopp, setup_hopp, overwrite_fin_values
 
 
 n_timesteps = 8760
+# maximum number of HOPP results held in memory across all HOPPComponent instances
+memory_cache_size = 256
 
 
 class HOPPComponent(om.ExplicitComponent):
@@ -18,26 +24,50 @@ class HOPPComponent(om.ExplicitComponent):
     This component uses caching to store and retrieve results of the HOPP model
     based on the configuration and project lifetime. The caching mechanism helps
     to avoid redundant computations and speeds up the execution by reusing previously
-    computed results when the same configuration is encountered.
+    computed results when the same configuration is encountered. Results are held in
+    memory for repeated evaluations within a run and stored on disk for later runs.
     """
 
+    # results keyed by configuration hash, shared by all instances and ordered from
+    # least to most recently used
+    _memory_cache: ClassVar[OrderedDict] = OrderedDict()
+
     def initialize(self):
         self.options.declare("tech_config", types=dict)
         self.options.declare("plant_config", types=dict)
 
     def setup(self):
+        # overwrite the fin_model values with the cost_info values once, rather than on every
+        # call to compute
+        self.hopp_config = overwrite_fin_values(
+            self.options["tech_config"]["performance_model"]["config"]
+        )
+        self.plant_life = self.options["plant_config"]["plant"]["plant_life"]
+        self.electrolyzer_rating = self.options["tech_config"].get("electrolyzer_rating")
+
+        # Create a unique hash for the configuration to use as a cache key. The component has no
+        # inputs, so the key is fixed once the component is set up. The config is serialized
+        # with sorted keys so that equivalent configurations map to the same key, and is fed to
+        # the hasher piece by piece rather than as one large string.
+        hasher = hashlib.blake2b(digest_size=16)
+        encoder = json.JSONEncoder(sort_keys=True, default=str)
+        for chunk in encoder.iterencode(
+            [self.hopp_config, self.plant_life, self.electrolyzer_rating]
+        ):
+            hasher.update(chunk.encode("utf-8"))
+        self.config_hash = hasher.hexdigest()
+
+        # Create a cache directory if it doesn't exist
+        self.cache_dir = Path("cache")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_file = self.cache_dir / f"{self.config_hash}.pkl"
+
         # Outputs
         self.add_output("electricity", val=np.zeros(n_timesteps), units="kW", desc="Power output")
         self.add_output("CapEx", val=0.0, units="USD", desc="Total capital expenditures")
         self.add_output("OpEx", val=0.0, units="USD/year", desc="Total fixed operating costs")
 
     def compute(self, inputs, outputs):
-        # Create a unique hash for the current configuration to use as a cache key
-        config_hash = hashlib.md5(
-            str(self.options["tech_config"]["performance_model"]["config"]).encode("utf-8")
-            + str(self.options["plant_config"]["plant"]["plant_life"]).encode("utf-8")
-        ).hexdigest()
-
         # Define the keys of interest from the HOPP results that we want to cache
         keys_of_interest = [
             "combined_hybrid_power_production_hopp",
@@ -45,41 +75,47 @@ class HOPPComponent(om.ExplicitComponent):
             "opex",
         ]
 
-        # Create a cache directory if it doesn't exist
-        cache_dir = Path("cache")
-        if not cache_dir.exists():
-            cache_dir.mkdir(parents=True)
-        cache_file = f"cache/{config_hash}.pkl"
-
-        # Check if the results for the current configuration are already cached
-        if Path(cache_file).exists():
-            # Load the cached results
-            cache_path = Path(cache_file)
-            with cache_path.open("rb") as f:
-                subset_of_hopp_results = dill.load(f)
-        else:
-            electrolyzer_rating = None
-            if "electrolyzer_rating" in self.options["tech_config"]:
-                electrolyzer_rating = self.options["tech_config"]["electrolyzer_rating"]
-
+        # Check if the results for the current configuration are already cached, first in
+        # memory and then on disk
+        subset_of_hopp_results = self._memory_cache.get(self.config_hash)
+        if subset_of_hopp_results is None:
+            try:
+                with self.cache_file.open("rb") as f:
+                    subset_of_hopp_results = pickle.load(f)
+            except FileNotFoundError:
+                pass
+
+        if subset_of_hopp_results is None:
             self.hybrid_interface = setup_hopp(
-                self.options["tech_config"]["performance_model"]["config"],
+                self.hopp_config,
                 self.options["plant_config"],
-                electrolyzer_rating,
+                self.electrolyzer_rating,
+                overwrite_fin_model=False,
             )
 
             # Run the HOPP model and get the results
-            hopp_results = run_hopp(
-                self.hybrid_interface, self.options["plant_config"]["plant"]["plant_life"]
-            )
+            hopp_results = run_hopp(self.hybrid_interface, self.plant_life)
             # Extract the subset of results we are interested in
             subset_of_hopp_results = {key: hopp_results[key] for key in keys_of_interest}
-            # Cache the results for future use
-            cache_path = Path(cache_file)
-            with cache_path.open("wb") as f:
-                dill.dump(subset_of_hopp_results, f)
+            # Cache the results for future use. The results are written to a temporary file and
+            # then moved into place, so that runs in parallel processes sharing the cache
+            # directory never read a partially written file.
+            with tempfile.NamedTemporaryFile("wb", dir=self.cache_dir, delete=False) as f:
+                temp_file = Path(f.name)
+                try:
+                    pickle.dump(subset_of_hopp_results, f, protocol=5)
+                except Exception:
+                    f.close()
+                    temp_file.unlink(missing_ok=True)
+                    raise
+            temp_file.replace(self.cache_file)
+
+        self._memory_cache[self.config_hash] = subset_of_hopp_results
+        self._memory_cache.move_to_end(self.config_hash)
+        if len(self._memory_cache) > memory_cache_size:
+            self._memory_cache.popitem(last=False)
 
         # Set the outputs from the cached or newly computed results
-        outputs["electricity"] = subset_of_hopp_results["combined_hybrid_power_production_hopp"]
+        outputs["electricity"][:] = subset_of_hopp_results["combined_hybrid_power_production_hopp"]
         outputs["CapEx"] = subset_of_hopp_results["capex"]
         outputs["OpEx"] = subset_of_hopp_results["opex"]
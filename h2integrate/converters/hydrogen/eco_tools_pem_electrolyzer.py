@@ -167,6 +167,16 @@ class ECOElectrolyzerCostModel(ElectrolyzerCostBaseClass):
             merge_shared_cost_inputs(self.options["tech_config"]["model_inputs"])
         )
 
+        # the electrolyzer location is fixed by the config, so set up the location-dependent
+        # cost model once rather than on every call to compute
+        if self.config.location == "onshore":
+            self.offshore = 0
+        else:
+            self.offshore = 1
+
+        if self.config.cost_model == "singlitico2021":
+            self.pem_cost_model = PEMCostsSingliticoModel(elec_location=self.offshore)
+
     def compute(self, inputs, outputs):
         # unpack inputs
         plant_config = self.options["plant_config"]
@@ -179,11 +189,6 @@ class ECOElectrolyzerCostModel(ElectrolyzerCostBaseClass):
         electrolyzer_cost_model = self.config.cost_model  # can be "basic" or "singlitico2021"
 
         # run hydrogen production cost model - from hopp examples
-        if self.config.location == "onshore":
-            offshore = 0
-        else:
-            offshore = 1
-
         if electrolyzer_cost_model == "basic":
             (
                 cf_h2_annuals,
@@ -204,18 +209,16 @@ class ECOElectrolyzerCostModel(ElectrolyzerCostBaseClass):
                 0.0,
                 0.0,
                 include_refurb_in_opex=False,
-                offshore=offshore,
+                offshore=self.offshore,
             )
         elif electrolyzer_cost_model == "singlitico2021":
             P_elec = electrolyzer_size_mw * 1e-3  # [GW]
             RC_elec = self.config.electrolyzer_capex  # [USD/kW]
 
-            pem_offshore = PEMCostsSingliticoModel(elec_location=offshore)
-
             (
                 electrolyzer_capital_cost_musd,
                 electrolyzer_om_cost_musd,
-            ) = pem_offshore.run(P_elec, RC_elec)
+            ) = self.pem_cost_model.run(P_elec, RC_elec)
 
             electrolyzer_total_capital_cost = (
                 electrolyzer_capital_cost_musd * 1e6
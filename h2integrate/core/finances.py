@@ -1,7 +1,6 @@
 import numpy as np
 import ProFAST  # system financial model
 import openmdao.api as om
-import numpy_financial as npf
 
 
 class AdjustedCapexOpexComp(om.ExplicitComponent):
@@ -33,8 +32,9 @@ class AdjustedCapexOpexComp(om.ExplicitComponent):
             opex = float(inputs[f"opex_{tech}"][0])
             cost_year = self.discount_years[tech]
             periods = self.cost_year - cost_year
-            adjusted_capex = -npf.fv(self.inflation_rate, periods, 0.0, capex)
-            adjusted_opex = -npf.fv(self.inflation_rate, periods, 0.0, opex)
+            inflation_factor = (1.0 + self.inflation_rate) ** periods
+            adjusted_capex = capex * inflation_factor
+            adjusted_opex = opex * inflation_factor
             outputs[f"capex_adjusted_{tech}"] = adjusted_capex
             outputs[f"opex_adjusted_{tech}"] = adjusted_opex
             total_capex_adjusted += adjusted_capex
@@ -217,7 +217,7 @@ class ProFastComp(om.ExplicitComponent):
                 ] = self.tech_config["electrolyzer"]["model_inputs"]["financial_parameters"][
                     "replacement_cost_percent"
                 ]
-                electrolyzer_refurbishment_schedule = list(electrolyzer_refurbishment_schedule)
+                electrolyzer_refurbishment_schedule = electrolyzer_refurbishment_schedule.tolist()
 
                 pf.add_capital_item(
                     name="Electrolysis System",
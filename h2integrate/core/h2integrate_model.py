@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import yaml
 import numpy as np
 import openmdao.api as om
 
@@ -8,8 +7,17 @@ from h2integrate.core.finances import ProFastComp, AdjustedCapexOpexComp
 from h2integrate.core.utilities import create_xdsm_from_config
 from h2integrate.core.feedstocks import FeedstockComponent
 from h2integrate.core.resource_summer import ElectricitySumComp
-from h2integrate.core.supported_models import supported_models, electricity_producing_techs
-from h2integrate.core.inputs.validation import load_tech_yaml, load_plant_yaml, load_driver_yaml
+from h2integrate.core.supported_models import (
+    supported_models,
+    commodity_producing_techs,
+    electricity_producing_techs,
+)
+from h2integrate.core.inputs.validation import (
+    load_tech_yaml,
+    load_plant_yaml,
+    load_driver_yaml,
+    load_yaml_cached,
+)
 from h2integrate.core.pose_optimization import PoseOptimization
 
 
@@ -51,8 +59,7 @@ class H2IntegrateModel:
 
     def load_config(self, config_file):
         config_path = Path(config_file)
-        with config_path.open() as file:
-            config = yaml.safe_load(file)
+        config = load_yaml_cached(config_path)
 
         self.name = config.get("name")
         self.system_summary = config.get("system_summary")
@@ -225,10 +232,11 @@ class H2IntegrateModel:
         # Add each financial group to the plant
         for group_id, tech_configs in financial_groups.items():
             commodity_types = ["electricity"]
-            if "electrolyzer" in tech_configs:
-                commodity_types.append("hydrogen")
-            if "ammonia" in tech_configs:
-                commodity_types.append("ammonia")
+            commodity_types.extend(
+                commodity
+                for tech, commodity in commodity_producing_techs.items()
+                if tech in tech_configs
+            )
 
             # Steel provides its own financials
             if "steel" in tech_configs:
@@ -267,6 +275,10 @@ class H2IntegrateModel:
 
         combiner_counts = {}
 
+        # Check if there are any connections FROM a financial group to ammonia
+        # This handles the case where LCOH is computed in the financial group and passed to ammonia
+        financials_to_ammonia = False
+
         # loop through each linkage and instantiate an OpenMDAO object (assume it exists) for
         # the connection type (e.g. cable, pipeline, etc)
         for connection in technology_interconnections:
@@ -299,10 +311,7 @@ class H2IntegrateModel:
                 if "combiner" in dest_tech:
                     # Connect the source technology to the connection component
                     # with specific input names
-                    if dest_tech not in combiner_counts:
-                        combiner_counts[dest_tech] = 1
-                    else:
-                        combiner_counts[dest_tech] += 1
+                    combiner_counts[dest_tech] = combiner_counts.get(dest_tech, 0) + 1
 
                     # Connect the connection component to the destination technology
                     self.plant.connect(
@@ -328,6 +337,9 @@ class H2IntegrateModel:
                 # connect directly from source to dest
                 source_tech, dest_tech, connected_parameter = connection
 
+                if source_tech.startswith("financials_group_") and dest_tech == "ammonia":
+                    financials_to_ammonia = True
+
                 self.plant.connect(
                     f"{source_tech}.{connected_parameter}", f"{dest_tech}.{connected_parameter}"
                 )
@@ -385,17 +397,13 @@ class H2IntegrateModel:
 
         self.plant.options["auto_order"] = True
 
-        # Check if there are any connections FROM a financial group to ammonia
-        # This handles the case where LCOH is computed in the financial group and passed to ammonia
-        for connection in technology_interconnections:
-            if connection[0].startswith("financials_group_") and connection[1] == "ammonia":
-                # If the connection is from a financial group, set solvers for the
-                # plant to resolve the coupling
-                self.plant.nonlinear_solver = om.NonlinearBlockGS()
-                self.plant.linear_solver = om.DirectSolver()
-                break
-
-        if pyxdsm is not None:
+        if financials_to_ammonia:
+            # If the connection is from a financial group, set solvers for the
+            # plant to resolve the coupling
+            self.plant.nonlinear_solver = om.NonlinearBlockGS()
+            self.plant.linear_solver = om.DirectSolver(assemble_jac=True)
+
+        if pyxdsm is not None and self.driver_config.get("general", {}).get("create_xdsm", False):
             create_xdsm_from_config(self.plant_config)
 
     def create_driver_model(self):
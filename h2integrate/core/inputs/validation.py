@@ -13,10 +13,49 @@ import ruamel.yaml as ry
 from hopp.utilities import load_yaml
 
 
+# use the libyaml-based loader when PyYAML was built with it, as it is much faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
 fschema_tech = Path(__file__).parent / "tech_schema.yaml"
 fschema_plant = Path(__file__).parent / "plant_schema.yaml"
 fschema_driver = Path(__file__).parent / "driver_schema.yaml"
 
+# parsed YAML files and the modification times of their includes, keyed by resolved path and
+# modification time
+_yaml_cache = {}
+
+
+class IncludeLoader(SafeLoader):
+    """
+    YAML loader that resolves ``!include`` tags relative to the directory of the file being
+    loaded, matching the loader used by HOPP.
+    """
+
+    def __init__(self, stream):
+        self._root = Path(stream.name).parent
+        # every file pulled in through ``!include``, including nested includes
+        self.included = []
+        super().__init__(stream)
+
+    def include(self, node):
+        fpath = self._root / self.construct_scalar(node)
+        with fpath.open() as f:
+            loader = self.__class__(f)
+            try:
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
+        self.included.append(fpath)
+        self.included.extend(loader.included)
+        return data
+
+
+IncludeLoader.add_constructor("!include", IncludeLoader.include)
+
 
 def write_yaml(instance: dict, foutput: str) -> None:
     """
@@ -41,6 +80,50 @@ def write_yaml(instance: dict, foutput: str) -> None:
         yaml.dump(instance, f)
 
 
+def load_yaml_cached(finput) -> dict:
+    """
+    Loads a YAML file, reusing the parsed contents if neither the file nor any file it includes
+    has changed since it was last loaded.
+
+    Args:
+        finput (dict or str or Path): Dictionary or path to the YAML file to be loaded.
+
+    Returns:
+        dict: Copy of the parsed YAML file, which the caller is free to modify. Dictionaries are
+            returned as is.
+    """
+    if isinstance(finput, dict):
+        return finput
+
+    fpath = Path(finput)
+    key = (str(fpath.resolve()), fpath.stat().st_mtime_ns)
+    cached = _yaml_cache.get(key)
+    if cached is None or not _includes_unchanged(cached[1]):
+        with fpath.open() as f:
+            loader = IncludeLoader(f)
+            try:
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
+        includes = tuple((p.resolve(), p.stat().st_mtime_ns) for p in loader.included)
+        cached = _yaml_cache[key] = (data, includes)
+    return copy.deepcopy(cached[0])
+
+
+def _includes_unchanged(includes) -> bool:
+    """
+    Checks whether the files included by a cached YAML file still have their recorded
+    modification times.
+    """
+    for fpath, mtime_ns in includes:
+        try:
+            if fpath.stat().st_mtime_ns != mtime_ns:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
 # ---------------------
 # This is for when the defaults are in another file
 def nested_get(indict, keylist):
@@ -151,8 +234,8 @@ def _validate(finput, fschema, defaults=True):
     Returns:
         dict: Validated dictionary.
     """
-    schema_dict = fschema if isinstance(fschema, dict) else load_yaml(fschema)
-    input_dict = finput if isinstance(finput, dict) else load_yaml(finput)
+    schema_dict = load_yaml_cached(fschema)
+    input_dict = load_yaml_cached(finput)
     validator = DefaultValidatingDraft7Validator if defaults else json.Draft7Validator
     validator(schema_dict).validate(input_dict)
     return input_dict
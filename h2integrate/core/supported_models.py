@@ -1,70 +1,128 @@
-from h2integrate.transporters.pipe import PipePerformanceModel
-from h2integrate.transporters.cable import CablePerformanceModel
-from h2integrate.converters.steel.steel import SteelPerformanceModel, SteelCostAndFinancialModel
-from h2integrate.converters.wind.wind_plant import WindPlantCostModel, WindPlantPerformanceModel
-from h2integrate.transporters.power_combiner import CombinerPerformanceModel
-from h2integrate.converters.hopp.hopp_wrapper import HOPPComponent
-from h2integrate.converters.solar.solar_pysam import PYSAMSolarPlantPerformanceModel
-from h2integrate.storage.hydrogen.eco_storage import H2Storage
-from h2integrate.storage.hydrogen.tank_baseclass import (
-    HydrogenTankCostModel,
-    HydrogenTankPerformanceModel,
-)
-from h2integrate.converters.wind.wind_plant_pysam import PYSAMWindPlantPerformanceModel
-from h2integrate.converters.wind.dummy_wind_turbine import DummyPlantCost, DummyPlantPerformance
-from h2integrate.converters.ammonia.ammonia_baseclass import (
-    AmmoniaCostModel,
-    AmmoniaPerformanceModel,
-)
-from h2integrate.converters.desalination.desalination import (
-    ReverseOsmosisCostModel,
-    ReverseOsmosisPerformanceModel,
-)
-from h2integrate.converters.hydrogen.pem_electrolyzer import (
-    ElectrolyzerCostModel,
-    ElectrolyzerFinanceModel,
-    ElectrolyzerPerformanceModel,
-)
-from h2integrate.converters.hydrogen.dummy_electrolyzer import (
-    DummyElectrolyzerCostModel,
-    DummyElectrolyzerPerformanceModel,
-)
-from h2integrate.converters.hydrogen.eco_tools_pem_electrolyzer import (
-    ECOElectrolyzerCostModel,
-    ECOElectrolyzerPerformanceModel,
-)
+import importlib
+from collections.abc import Mapping
+
+
+class _LazyModelRegistry(Mapping):
+    """
+    Read-only mapping of supported models that imports each model class the first time it is
+    looked up.
 
+    Models are registered as ``(module name, class name)`` pairs, so only the models used in a
+    given run are imported. Every way of reading the mapping returns the model classes.
+    """
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._models = {}
+
+    def __getitem__(self, key):
+        model = self._models.get(key)
+        if model is None:
+            module_name, class_name = self._registry[key]
+            model = self._models[key] = getattr(importlib.import_module(module_name), class_name)
+        return model
+
+    def __contains__(self, key):
+        # checked against the registry so that membership tests do not import the model
+        return key in self._registry
+
+    def __iter__(self):
+        return iter(self._registry)
+
+    def __len__(self):
+        return len(self._registry)
+
+
+supported_models = _LazyModelRegistry(
+    {
+        # Converters
+        "dummy_wind_turbine_performance": (
+            "h2integrate.converters.wind.dummy_wind_turbine",
+            "DummyPlantPerformance",
+        ),
+        "dummy_wind_turbine_cost": (
+            "h2integrate.converters.wind.dummy_wind_turbine",
+            "DummyPlantCost",
+        ),
+        "dummy_electrolyzer_performance": (
+            "h2integrate.converters.hydrogen.dummy_electrolyzer",
+            "DummyElectrolyzerPerformanceModel",
+        ),
+        "dummy_electrolyzer_cost": (
+            "h2integrate.converters.hydrogen.dummy_electrolyzer",
+            "DummyElectrolyzerCostModel",
+        ),
+        "wind_plant_performance": (
+            "h2integrate.converters.wind.wind_plant",
+            "WindPlantPerformanceModel",
+        ),
+        "wind_plant_cost": ("h2integrate.converters.wind.wind_plant", "WindPlantCostModel"),
+        "pysam_wind_plant_performance": (
+            "h2integrate.converters.wind.wind_plant_pysam",
+            "PYSAMWindPlantPerformanceModel",
+        ),
+        "pysam_solar_plant_performance": (
+            "h2integrate.converters.solar.solar_pysam",
+            "PYSAMSolarPlantPerformanceModel",
+        ),
+        "pem_electrolyzer_performance": (
+            "h2integrate.converters.hydrogen.pem_electrolyzer",
+            "ElectrolyzerPerformanceModel",
+        ),
+        "pem_electrolyzer_cost": (
+            "h2integrate.converters.hydrogen.pem_electrolyzer",
+            "ElectrolyzerCostModel",
+        ),
+        "pem_electrolyzer_financial": (
+            "h2integrate.converters.hydrogen.pem_electrolyzer",
+            "ElectrolyzerFinanceModel",
+        ),
+        "eco_pem_electrolyzer_performance": (
+            "h2integrate.converters.hydrogen.eco_tools_pem_electrolyzer",
+            "ECOElectrolyzerPerformanceModel",
+        ),
+        "eco_pem_electrolyzer_cost": (
+            "h2integrate.converters.hydrogen.eco_tools_pem_electrolyzer",
+            "ECOElectrolyzerCostModel",
+        ),
+        "h2_storage": ("h2integrate.storage.hydrogen.eco_storage", "H2Storage"),
+        "hopp": ("h2integrate.converters.hopp.hopp_wrapper", "HOPPComponent"),
+        "reverse_osmosis_desalination_performance": (
+            "h2integrate.converters.desalination.desalination",
+            "ReverseOsmosisPerformanceModel",
+        ),
+        "reverse_osmosis_desalination_cost": (
+            "h2integrate.converters.desalination.desalination",
+            "ReverseOsmosisCostModel",
+        ),
+        "ammonia_performance": (
+            "h2integrate.converters.ammonia.ammonia_baseclass",
+            "AmmoniaPerformanceModel",
+        ),
+        "ammonia_cost": ("h2integrate.converters.ammonia.ammonia_baseclass", "AmmoniaCostModel"),
+        "steel_performance": ("h2integrate.converters.steel.steel", "SteelPerformanceModel"),
+        "steel_cost": ("h2integrate.converters.steel.steel", "SteelCostAndFinancialModel"),
+        # Transport
+        "cable": ("h2integrate.transporters.cable", "CablePerformanceModel"),
+        "pipe": ("h2integrate.transporters.pipe", "PipePerformanceModel"),
+        "combiner_performance": (
+            "h2integrate.transporters.power_combiner",
+            "CombinerPerformanceModel",
+        ),
+        # Storage
+        "hydrogen_tank_performance": (
+            "h2integrate.storage.hydrogen.tank_baseclass",
+            "HydrogenTankPerformanceModel",
+        ),
+        "hydrogen_tank_cost": (
+            "h2integrate.storage.hydrogen.tank_baseclass",
+            "HydrogenTankCostModel",
+        ),
+    }
+)
 
-supported_models = {
-    # Converters
-    "dummy_wind_turbine_performance": DummyPlantPerformance,
-    "dummy_wind_turbine_cost": DummyPlantCost,
-    "dummy_electrolyzer_performance": DummyElectrolyzerPerformanceModel,
-    "dummy_electrolyzer_cost": DummyElectrolyzerCostModel,
-    "wind_plant_performance": WindPlantPerformanceModel,
-    "wind_plant_cost": WindPlantCostModel,
-    "pysam_wind_plant_performance": PYSAMWindPlantPerformanceModel,
-    "pysam_solar_plant_performance": PYSAMSolarPlantPerformanceModel,
-    "pem_electrolyzer_performance": ElectrolyzerPerformanceModel,
-    "pem_electrolyzer_cost": ElectrolyzerCostModel,
-    "pem_electrolyzer_financial": ElectrolyzerFinanceModel,
-    "eco_pem_electrolyzer_performance": ECOElectrolyzerPerformanceModel,
-    "eco_pem_electrolyzer_cost": ECOElectrolyzerCostModel,
-    "h2_storage": H2Storage,
-    "hopp": HOPPComponent,
-    "reverse_osmosis_desalination_performance": ReverseOsmosisPerformanceModel,
-    "reverse_osmosis_desalination_cost": ReverseOsmosisCostModel,
-    "ammonia_performance": AmmoniaPerformanceModel,
-    "ammonia_cost": AmmoniaCostModel,
-    "steel_performance": SteelPerformanceModel,
-    "steel_cost": SteelCostAndFinancialModel,
-    # Transport
-    "cable": CablePerformanceModel,
-    "pipe": PipePerformanceModel,
-    "combiner_performance": CombinerPerformanceModel,
-    # Storage
-    "hydrogen_tank_performance": HydrogenTankPerformanceModel,
-    "hydrogen_tank_cost": HydrogenTankCostModel,
-}
+electricity_producing_techs = frozenset(("wind", "solar", "hopp"))
 
-electricity_producing_techs = ["wind", "solar", "hopp"]
+# maps technologies to the commodity a financial group prices when it contains them, in the order
+# the commodities are added to the group
+commodity_producing_techs = {"electrolyzer": "hydrogen", "ammonia": "ammonia"}
@@ -0,0 +1,27 @@
+from pytest import raises
+
+from h2integrate.transporters.pipe import PipePerformanceModel
+from h2integrate.transporters.cable import CablePerformanceModel
+from h2integrate.core.supported_models import supported_models
+
+
+def test_supported_models(subtests):
+    with subtests.test("lookup"):
+        assert supported_models["cable"] is CablePerformanceModel
+
+    with subtests.test("get"):
+        assert supported_models.get("pipe") is PipePerformanceModel
+        assert supported_models.get("not_a_model") is None
+
+    with subtests.test("items"):
+        assert all(isinstance(model, type) for _, model in supported_models.items())
+
+    with subtests.test("values"):
+        assert all(isinstance(model, type) for model in supported_models.values())
+
+    with subtests.test("plain dictionary"):
+        assert dict(supported_models)["cable"] is CablePerformanceModel
+
+    with subtests.test("read only"):
+        with raises(TypeError):
+            supported_models["cable"] = PipePerformanceModel
@@ -0,0 +1,32 @@
+from pytest import raises
+
+from h2integrate.core.utilities import merge_shared_cost_inputs, merge_shared_performance_inputs
+
+
+def test_merge_shared_inputs(subtests):
+    model_inputs = {
+        "shared_parameters": {"capacity": 10.0},
+        "performance_parameters": {"efficiency": 0.5},
+        "cost_parameters": {"capex": 100.0},
+    }
+
+    with subtests.test("performance"):
+        merged = merge_shared_performance_inputs(model_inputs)
+        assert merged == {"capacity": 10.0, "efficiency": 0.5}
+
+    with subtests.test("cost"):
+        merged = merge_shared_cost_inputs(model_inputs)
+        assert merged == {"capacity": 10.0, "capex": 100.0}
+
+    with subtests.test("shared only"):
+        merged = merge_shared_cost_inputs({"shared_parameters": {"capacity": 10.0}})
+        assert merged == {"capacity": 10.0}
+
+    with subtests.test("no shared"):
+        merged = merge_shared_performance_inputs({"performance_parameters": {"efficiency": 0.5}})
+        assert merged == {"efficiency": 0.5}
+
+    with subtests.test("duplicate parameters"):
+        model_inputs["cost_parameters"]["capacity"] = 5.0
+        with raises(ValueError, match="shared and cost dictionaries"):
+            merge_shared_cost_inputs(model_inputs)
@@ -0,0 +1,39 @@
+import os
+
+from h2integrate.core.inputs.validation import load_yaml_cached
+
+
+def test_load_yaml_cached(subtests, tmp_path):
+    fpath = tmp_path / "config.yaml"
+    fpath.write_text("name: test\nvalues:\n  a: 1\n")
+
+    with subtests.test("returns independent copies"):
+        config = load_yaml_cached(fpath)
+        config["values"]["a"] = 2
+        assert load_yaml_cached(fpath) == {"name": "test", "values": {"a": 1}}
+
+    with subtests.test("reloads modified file"):
+        fpath.write_text("name: changed\n")
+        stat = fpath.stat()
+        os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_yaml_cached(fpath) == {"name": "changed"}
+
+    with subtests.test("passes through dictionaries"):
+        config = {"name": "dict"}
+        assert load_yaml_cached(config) is config
+
+    with subtests.test("reloads modified include"):
+        (tmp_path / "child.yaml").write_text("x: 1\n")
+        (tmp_path / "grandchild.yaml").write_text("y: 1\n")
+        (tmp_path / "middle.yaml").write_text("grandchild: !include grandchild.yaml\n")
+        top = tmp_path / "top.yaml"
+        top.write_text("child: !include child.yaml\nmiddle: !include middle.yaml\n")
+        assert load_yaml_cached(top) == {"child": {"x": 1}, "middle": {"grandchild": {"y": 1}}}
+
+        for name, text in (("child.yaml", "x: 2\n"), ("grandchild.yaml", "y: 2\n")):
+            include = tmp_path / name
+            include.write_text(text)
+            stat = include.stat()
+            os.utime(include, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_yaml_cached(top) == {"child": {"x": 2}, "middle": {"grandchild": {"y": 2}}}
@@ -1,4 +1,5 @@
 from typing import Any
+from functools import cache
 from collections import OrderedDict
 
 import attrs
@@ -70,36 +71,65 @@ def merge_inputs(dict1, dict2):
     return {**dict1, **dict2}
 
 
+def merge_shared_inputs(config, input_type):
+    """Merges the shared parameters with the ``<input_type>_parameters`` of a model inputs
+    dictionary and raises ValueError if duplicate keys exist.
+
+    Args:
+        config (dict): model inputs dictionary, i.e. ``tech_config["model_inputs"]``.
+        input_type (str): type of parameters to merge with the shared parameters,
+            e.g. "performance" or "cost".
+
+    Returns:
+        dict: the merged parameters.
+    """
+    params_key = f"{input_type}_parameters"
+    if "shared_parameters" not in config:
+        return config[params_key]
+
+    shared_params = config["shared_parameters"]
+    if params_key not in config:
+        return shared_params
+
+    params = config[params_key]
+    common_keys = params.keys() & shared_params.keys()
+    if common_keys:
+        raise ValueError(
+            f"Duplicate parameters found: {', '.join(common_keys)}. "
+            f"Please define parameters only once in the shared and {input_type} dictionaries."
+        )
+    return {**params, **shared_params}
+
+
 def merge_shared_performance_inputs(config):
     """Merges two dictionaries and raises ValueError if duplicate keys exist."""
-    if "performance_parameters" in config.keys() and "shared_parameters" in config.keys():
-        common_keys = config["performance_parameters"].keys() & config["shared_parameters"].keys()
-        if common_keys:
-            raise ValueError(
-                f"Duplicate parameters found: {', '.join(common_keys)}. "
-                f"Please define parameters only once in the shared and performance dictionaries."
-            )
-        return {**config["performance_parameters"], **config["shared_parameters"]}
-    elif "shared_parameters" not in config.keys():
-        return config["performance_parameters"]
-    else:
-        return config["shared_parameters"]
+    return merge_shared_inputs(config, "performance")
 
 
 def merge_shared_cost_inputs(config):
     """Merges two dictionaries and raises ValueError if duplicate keys exist."""
-    if "cost_parameters" in config.keys() and "shared_parameters" in config.keys():
-        common_keys = config["cost_parameters"].keys() & config["shared_parameters"].keys()
-        if common_keys:
-            raise ValueError(
-                f"Duplicate parameters found: {', '.join(common_keys)}. "
-                f"Please define parameters only once in the shared and cost dictionaries."
-            )
-        return {**config["cost_parameters"], **config["shared_parameters"]}
-    elif "shared_parameters" not in config.keys():
-        return config["cost_parameters"]
-    else:
-        return config["shared_parameters"]
+    return merge_shared_inputs(config, "cost")
+
+
+@cache
+def _attrs_field_names(cls):
+    """Collects the field names of an `attr`-defined class used by `BaseConfig.from_dict`.
+
+    The field definitions of a class do not change, so they are only gathered once per class.
+
+    Returns:
+        3-element tuple containing
+
+        - **attr_names** (frozenset): names of all fields.
+        - **init_names** (tuple): names of the fields set by ``__init__``, in definition order.
+        - **required_inputs** (frozenset): names of the ``__init__`` fields without a default.
+    """
+    attr_names = frozenset(a.name for a in cls.__attrs_attrs__)
+    init_names = tuple(a.name for a in cls.__attrs_attrs__ if a.init)
+    required_inputs = frozenset(
+        a.name for a in cls.__attrs_attrs__ if a.init and a.default is attrs.NOTHING
+    )
+    return attr_names, init_names, required_inputs
 
 
 @define
@@ -126,23 +156,21 @@ class BaseConfig:
             cls
                 The `attr`-defined class.
         """
+        attr_names, init_names, required_inputs = _attrs_field_names(cls)
+
         # Check for any inputs that aren't part of the class definition
         if strict is True:
-            class_attr_names = [a.name for a in cls.__attrs_attrs__]
-            extra_args = [d for d in data if d not in class_attr_names]
+            extra_args = [d for d in data if d not in attr_names]
             if len(extra_args):
                 raise AttributeError(
                     f"The initialization for {cls.__name__} \
                         was given extraneous inputs: {extra_args}"
                 )
 
-        kwargs = {a.name: data[a.name] for a in cls.__attrs_attrs__ if a.name in data and a.init}
+        kwargs = {name: data[name] for name in init_names if name in data}
 
         # Map the inputs must be provided: 1) must be initialized, 2) no default value defined
-        required_inputs = [
-            a.name for a in cls.__attrs_attrs__ if a.init and a.default is attrs.NOTHING
-        ]
-        undefined = sorted(set(required_inputs) - set(kwargs))
+        undefined = sorted(required_inputs - set(kwargs))
 
         if undefined:
             raise AttributeError(
@@ -17,8 +17,5 @@ def calc_custom_electrolysis_capex_fom(electrolyzer_capacity_kW, electrolyzer_co
         - **fixed_om** (float): electrolyzer fixed O&M in $/year
     """
     electrolyzer_capex = electrolyzer_config["electrolyzer_capex"] * electrolyzer_capacity_kW
-    if "fixed_om_per_kw" in electrolyzer_config.keys():
-        electrolyzer_fopex = electrolyzer_config["fixed_om_per_kw"] * electrolyzer_capacity_kW
-    else:
-        electrolyzer_fopex = 0.0
+    electrolyzer_fopex = electrolyzer_config.get("fixed_om_per_kw", 0.0) * electrolyzer_capacity_kW
     return electrolyzer_capex, electrolyzer_fopex
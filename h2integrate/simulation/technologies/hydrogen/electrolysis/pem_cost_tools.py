@@ -35,27 +35,20 @@ class ElectrolyzerLCOHInputConfig:
     replacement_schedule: list[float] = field(init=False)
 
     def __attrs_post_init__(self):
-        annual_performance = self.electrolyzer_physics_results["H2_Results"][
-            "Performance Schedules"
-        ]
+        h2_results = self.electrolyzer_physics_results["H2_Results"]
+        annual_performance = h2_results["Performance Schedules"]
 
         #: electrolyzer system capacity in kW
-        self.electrolyzer_capacity_kW = self.electrolyzer_physics_results["H2_Results"][
-            "system capacity [kW]"
-        ]
+        self.electrolyzer_capacity_kW = h2_results["system capacity [kW]"]
 
         #: int: lifetime of project in years
         self.project_lifetime_years = len(annual_performance)
 
         #: float: electrolyzer beginnning-of-life rated H2 production capacity in kg/day
-        self.rated_capacity_kg_pr_day = (
-            self.electrolyzer_physics_results["H2_Results"]["Rated BOL: H2 Production [kg/hr]"] * 24
-        )
+        self.rated_capacity_kg_pr_day = h2_results["Rated BOL: H2 Production [kg/hr]"] * 24
 
         #: float: water usage in gallons of water per kg of H2
-        self.water_usage_gal_pr_kg = self.electrolyzer_physics_results["H2_Results"][
-            "Rated BOL: Gal H2O per kg-H2"
-        ]
+        self.water_usage_gal_pr_kg = h2_results["Rated BOL: Gal H2O per kg-H2"]
         #: list(float): annual energy consumed by electrolyzer per year of operation in kWh/year
         self.electrolyzer_annual_energy_usage_kWh = annual_performance[
             "Annual Energy Used [kWh/year]"
@@ -69,7 +62,7 @@ class ElectrolyzerLCOHInputConfig:
             "Annual H2 Production [kg/year]"
         ]
         #: dict: annual capacity factor of electrolyzer for each year of operation
-        self.long_term_utilization = self.make_lifetime_utilization()
+        self.long_term_utilization = self.make_lifetime_utilization(annual_performance)
 
         use_complex_refurb = False
         if "complex_refurb" in self.electrolyzer_config.keys():
@@ -78,21 +71,15 @@ class ElectrolyzerLCOHInputConfig:
 
         # complex schedule assumes stacks are replaced in the year they reach end-of-life
         if use_complex_refurb:
-            self.replacement_schedule = self.calc_complex_refurb_schedule()
-            self.refurb_cost_percent = list(
-                np.array(
-                    self.replacement_schedule * self.electrolyzer_config["replacement_cost_percent"]
-                )
-            )
+            self.replacement_schedule = self.calc_complex_refurb_schedule(annual_performance)
 
         # simple schedule assumes all stacks are replaced in the same year
         else:
             self.replacement_schedule = self.calc_simple_refurb_schedule()
-            self.refurb_cost_percent = list(
-                np.array(
-                    self.replacement_schedule * self.electrolyzer_config["replacement_cost_percent"]
-                )
-            )
+
+        self.refurb_cost_percent = (
+            self.replacement_schedule * self.electrolyzer_config["replacement_cost_percent"]
+        ).tolist()
 
     def calc_simple_refurb_schedule(self):
         """Calculate electrolyzer refurbishment schedule
@@ -102,45 +89,51 @@ class ElectrolyzerLCOHInputConfig:
             list: list of years when stacks are replaced.
             a value of 1 means stacks are replaced that year.
         """
-        annual_performance = self.electrolyzer_physics_results["H2_Results"][
-            "Performance Schedules"
-        ]
-        refurb_simple = np.zeros(len(annual_performance))
+        refurb_simple = np.zeros(self.project_lifetime_years)
         refurb_period = int(
             round(
                 self.electrolyzer_physics_results["H2_Results"]["Time Until Replacement [hrs]"]
                 / 8760
             )
         )
-        refurb_simple[refurb_period : len(annual_performance) : refurb_period] = 1.0
+        refurb_simple[refurb_period::refurb_period] = 1.0
 
         return refurb_simple
 
-    def calc_complex_refurb_schedule(self):
+    def calc_complex_refurb_schedule(self, annual_performance=None):
         """Calculate electrolyzer refurbishment schedule
             stacks are replaced in the year they reach EOL.
 
+        Args:
+            annual_performance (pd.DataFrame, optional): annual performance schedules from
+                ``H2_Results``. Looked up from the physics results if not provided.
+
         Returns:
             list: list of years when stacks are replaced. values are are fraction of
             the total installed capacity.
         """
-        annual_performance = self.electrolyzer_physics_results["H2_Results"][
-            "Performance Schedules"
-        ]
-        refurb_complex = annual_performance["Refurbishment Schedule [MW replaced/year]"].values / (
-            self.electrolyzer_capacity_kW / 1e3
-        )
+        if annual_performance is None:
+            annual_performance = self.electrolyzer_physics_results["H2_Results"][
+                "Performance Schedules"
+            ]
+        refurb_mw = annual_performance["Refurbishment Schedule [MW replaced/year]"].to_numpy()
+        refurb_complex = refurb_mw * (1e3 / self.electrolyzer_capacity_kW)
         return refurb_complex
 
-    def make_lifetime_utilization(self):
+    def make_lifetime_utilization(self, annual_performance=None):
         """Make long term utilization dictionary for electrolyzer system.
 
+        Args:
+            annual_performance (pd.DataFrame, optional): annual performance schedules from
+                ``H2_Results``. Looked up from the physics results if not provided.
+
         Returns:
             dict: keys are years of operation and values are the capacity factor for that year.
         """
-        annual_performance = self.electrolyzer_physics_results["H2_Results"][
-            "Performance Schedules"
-        ]
+        if annual_performance is None:
+            annual_performance = self.electrolyzer_physics_results["H2_Results"][
+                "Performance Schedules"
+            ]
 
         years_of_operation = create_years_of_operation(
             self.project_lifetime_years,
@@ -165,12 +158,12 @@ def calc_electrolyzer_variable_om(electrolyzer_physics_results, h2integrate_conf
         dict | float: electrolyzer variable o&m in $/kg-H2.
     """
     electrolyzer_config = h2integrate_config["electrolyzer"]
-    annual_performance = electrolyzer_physics_results["H2_Results"]["Performance Schedules"]
 
     if "var_om" in electrolyzer_config.keys():
+        annual_performance = electrolyzer_physics_results["H2_Results"]["Performance Schedules"]
         electrolyzer_vopex_pr_kg = (
             electrolyzer_config["var_om"]
-            * annual_performance["Annual Average Efficiency [kWh/kg]"].values
+            * annual_performance["Annual Average Efficiency [kWh/kg]"].to_numpy()
         )
 
         if "analysis_start_year" not in h2integrate_config["finance_parameters"]:
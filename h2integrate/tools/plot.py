@@ -1,11 +1,16 @@
 import datetime as dt
 from pathlib import Path
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
 
+# long time series lines are drawn by Agg in chunks of this many vertices
+AGG_PATH_CHUNKSIZE = 10000
+
+
 def get_hour_from_datetime(dt_start: dt.datetime, dt_end: dt.datetime) -> tuple[int, int]:
     """Takes in two times in datetime format and returns the two times as hour of the year.
     This function is intended for use with plots where data may span a full year, but only
@@ -28,6 +33,68 @@ def get_hour_from_datetime(dt_start: dt.datetime, dt_end: dt.datetime) -> tuple[
     return hour_start, hour_end
 
 
+@lru_cache(maxsize=4)
+def _read_energy_flow_csv(energy_flow_data_path: str, mtime_ns: int) -> pd.DataFrame:
+    # ``mtime_ns`` is only part of the cache key so that an updated file is re-read
+    return pd.read_csv(energy_flow_data_path, index_col=0)
+
+
+def load_energy_flow_data(energy_flow_data_path: str | Path) -> pd.DataFrame:
+    """Loads the h2integrate energy flow output file, reusing the parsed data when the same
+    unmodified file is plotted more than once.
+
+    Args:
+        energy_flow_data_path (str | Path): path to the h2integrate energy flow output file.
+
+    Returns:
+        pd.DataFrame: energy flow data indexed by the first column of the file. The returned
+            DataFrame is shared between calls and should not be modified in place.
+    """
+    path = Path(energy_flow_data_path).resolve()
+    return _read_energy_flow_csv(str(path), path.stat().st_mtime_ns)
+
+
+def downsample_indices(data, target_points: int = 2000) -> np.ndarray:
+    """Selects the rows of a time series to plot using min-max decimation.
+
+    The series is split into buckets and the positions of the minimum and maximum of each
+    bucket are kept, along with the first and last rows, so peaks and troughs are preserved.
+    The buckets are shared by all columns, so the number of buckets is divided by the number of
+    columns and at most ``2 * target_points + 2`` rows are returned. Decimating each plotted line
+    on its own keeps more detail than decimating many columns together. Series that are already
+    short are not reduced.
+
+    Args:
+        data (array-like): time series data with time along the first axis.
+        target_points (int, optional): number of buckets to reduce a single series to.
+            Defaults to 2000.
+
+    Returns:
+        np.ndarray: sorted positional indices of the rows to plot.
+    """
+    data = np.asarray(data, dtype=float)
+    if data.ndim == 1:
+        data = data[:, np.newaxis]
+    n, n_cols = data.shape
+    if n <= 2 * target_points:
+        return np.arange(n)
+
+    bucket = int(np.ceil(n / max(target_points // n_cols, 1)))
+    n_full = (n // bucket) * bucket
+    blocks = data[:n_full].reshape(-1, bucket, n_cols)
+    offsets = np.arange(0, n_full, bucket)[:, np.newaxis]
+    parts = [
+        (blocks.argmin(axis=1) + offsets).ravel(),
+        (blocks.argmax(axis=1) + offsets).ravel(),
+        np.array([0, n - 1]),
+    ]
+    if n_full < n:
+        tail = data[n_full:]
+        parts.extend([tail.argmin(axis=0) + n_full, tail.argmax(axis=0) + n_full])
+
+    return np.unique(np.concatenate(parts))
+
+
 def plot_hydrogen_flows(
     energy_flow_data_path: str = "./output/data/production/energy_flows.csv",
     start_date_time: dt.datetime = dt.datetime(2024, 1, 1, 0),
@@ -35,6 +102,7 @@ def plot_hydrogen_flows(
     save_path: str = "./output/figures/production/hydrogen-flow.pdf",
     show_fig: bool = True,
     save_fig: bool = True,
+    downsample: bool = True,
 ) -> None:
     """Generates a plot of the hydrogen dispatch from the h2integrate output.
 
@@ -50,47 +118,56 @@ def plot_hydrogen_flows(
             Defaults to True.
         save_fig (bool, optional): if True, figure will be saved.
             Defaults to True.
+        downsample (bool, optional): if True, long time series are reduced with min-max
+            decimation before plotting. Defaults to True.
     """
 
     # set start and end dates
     hour_start, hour_end = get_hour_from_datetime(start_date_time, end_date_time)
 
     # load data
-    df_data = pd.read_csv(energy_flow_data_path, index_col=0)
+    df_data = load_energy_flow_data(energy_flow_data_path)
     df_data = df_data.iloc[hour_start:hour_end]
 
     # set up plots
     fig, ax = plt.subplots(2, 1, sharex=True, figsize=(12, 6))
 
     # plot hydrogen production
-    df_h_out = df_data[["h2 production hourly [kg]"]] * 1e-3  # convert to t
-    h2_demand = df_data[["hydrogen demand [kg/h]"]].values.flatten() * 1e-3  # convert to t
+    df_h_out = df_data["h2 production hourly [kg]"].to_numpy() * 1e-3  # convert to t
+    h2_demand = df_data["hydrogen demand [kg/h]"].to_numpy() * 1e-3  # convert to t
 
     # plot storage SOC
-    df_h_soc = np.array(df_data[["hydrogen storage SOC [kg]"]] * 1e-3)  # convert to t
+    df_h_soc = df_data["hydrogen storage SOC [kg]"].to_numpy() * 1e-3  # convert to t
 
-    df_h_soc_change = np.array(
-        [(df_h_soc[i] - df_h_soc[i - 1]) for i in np.arange(0, len(df_h_soc))]
-    ).flatten()
+    # hourly change in storage SOC; the first hour has no previous value
+    df_h_soc_change = np.concatenate(([0.0], np.diff(df_h_soc)))
 
-    ax[0].plot(df_h_soc * 1e-3)
+    # net h2 available
+    net_flow = df_h_out - df_h_soc_change
+    net_flow[0] = h2_demand[0]
+
+    # each line is decimated on its own and plotted against the hours it keeps
+    def decimate(series):
+        idx = downsample_indices(series) if downsample else np.arange(len(series))
+        return idx, series[idx]
+
+    ax[0].plot(*decimate(df_h_soc * 1e-3), rasterized=True)
     ax[0].set(
         ylabel="H$_2$ storage SOC (kt)", xlabel="Hour", ylim=[0, np.ceil(np.max(df_h_soc * 1e-3))]
     )
 
     # plot net h2 available
-    net_flow = np.array(df_h_out).flatten() - np.array(df_h_soc_change)
-    net_flow[0] = h2_demand[0]
-    ax[1].plot(df_h_out, "-", label="Electrolyzer output", alpha=0.5)
-    ax[1].plot(net_flow, label="Net dispatch")
-    ax[1].plot(h2_demand, linestyle=":", label="Demand", color="k")
+    ax[1].plot(*decimate(df_h_out), "-", label="Electrolyzer output", alpha=0.5, rasterized=True)
+    ax[1].plot(*decimate(net_flow), label="Net dispatch", rasterized=True)
+    ax[1].plot(*decimate(h2_demand), linestyle=":", label="Demand", color="k", rasterized=True)
     ax[1].set(ylabel="Hydrogen (t)", xlabel="Hour", ylim=[0, np.max(df_h_out) * 1.4])
     ax[1].legend(frameon=False, ncol=3, loc=2)
 
     plt.tight_layout()
 
     if save_fig:
-        plt.savefig(save_path, transparent=True)
+        with plt.rc_context({"agg.path.chunksize": AGG_PATH_CHUNKSIZE}):
+            plt.savefig(save_path, transparent=True)
     if show_fig:
         plt.show()
 
@@ -102,6 +179,7 @@ def plot_energy_flows(
     save_path: str = "./output/figures/production/energy_flows.pdf",
     show_fig: bool = True,
     save_fig: bool = True,
+    downsample: bool = True,
 ) -> None:
     """Generates a plot of electricity and hydrogen dispatch for the specified period
 
@@ -118,15 +196,21 @@ def plot_energy_flows(
             Defaults to True.
         save_fig (bool, optional): If True, figures will be saved.
             Defaults to True.
+        downsample (bool, optional): If True, long time series are reduced with min-max
+            decimation before plotting. Defaults to True.
     """
 
     # set start and end dates
     hour_start, hour_end = get_hour_from_datetime(start_date_time, end_date_time)
 
     # load data
-    df_data = pd.read_csv(Path(energy_flow_data_path), index_col=0)
+    df_data = load_energy_flow_data(energy_flow_data_path)
     df_data = df_data.iloc[hour_start:hour_end]
 
+    # the columns drawn on each axis are decimated together, separately from the other axes
+    def decimate(df):
+        return df.iloc[downsample_indices(df)] if downsample else df
+
     # set up plots
     fig, ax = plt.subplots(2, 2, sharex=True, figsize=(10, 6))
 
@@ -141,21 +225,23 @@ def plot_energy_flows(
     df_e_out = df_data[df_e_out_names.keys()] * 1e-6
     df_e_out = df_e_out.rename(columns=df_e_out_names)
 
-    df_e_out.plot(
+    decimate(df_e_out).plot(
         ax=ax[0, 0],
         logy=False,
         ylabel="Electricity Output (GW)",
-        ylim=[0, max(df_e_out["wind generation [GW]"]) * 1.5],
+        ylim=[0, np.nanmax(df_e_out["wind generation [GW]"].to_numpy()) * 1.5],
+        rasterized=True,
     )
     ax[0, 0].legend(frameon=False)
 
     # plot battery charge/discharge
     df_batt_power = df_data[["battery charge [kW]", "battery discharge [kW]"]]
+    batt_power_max = np.nanmax(df_batt_power.to_numpy())
 
-    if (df_batt_power.max().values > 1e6).any():
+    if batt_power_max > 1e6:
         batt_scale = 1e-6
         batt_units = "GW"
-    elif (df_batt_power.max().values > 1e3).any():
+    elif batt_power_max > 1e3:
         batt_scale = 1e-3
         batt_units = "MW"
     else:
@@ -168,33 +254,26 @@ def plot_energy_flows(
             "battery discharge [kW]": f"battery discharge [{batt_units}]",
         }
     )
-    leg_info_batt_pow = df_batt_power.plot(
+    leg_info_batt_pow = decimate(df_batt_power).plot(
         ax=ax[0, 1],
         logy=False,
         ylabel=f"Battery Power ({batt_units})",
-        ylim=[
-            0,
-            max(
-                [
-                    max(df_batt_power[f"battery charge [{batt_units}]"]),
-                    max(df_batt_power[f"battery discharge [{batt_units}]"]),
-                ]
-            )
-            * 1.8,
-        ],
+        ylim=[0, batt_power_max * batt_scale * 1.8],
         legend=False,
+        rasterized=True,
     )
 
     ax01_twin = ax[0, 1].twinx()
 
     df_batt_soc = df_data[["battery state of charge [%]"]]
-    leg_info_batt_soc = df_batt_soc.plot(
+    leg_info_batt_soc = decimate(df_batt_soc).plot(
         ax=ax01_twin,
         ylabel="Battery SOC (%)",
         linestyle=":",
         color="k",
-        ylim=[0, max(df_batt_soc["battery state of charge [%]"]) * 1.8],
+        ylim=[0, np.nanmax(df_batt_soc["battery state of charge [%]"].to_numpy()) * 1.8],
         legend=False,
+        rasterized=True,
     )
 
     leg_lines = leg_info_batt_pow.lines + leg_info_batt_soc.lines
@@ -212,12 +291,13 @@ def plot_energy_flows(
     df_e_usage = df_e_usage.rename(
         columns={"electrolyzer energy hourly [kW]": "electrolyzer energy hourly [GW]"}
     )
-    df_e_usage.plot(
+    decimate(df_e_usage).plot(
         ax=ax[1, 0],
         logy=False,
         ylabel="Electricity Usage (GW)",
         xlabel="Hour",
-        ylim=[0, max(df_e_usage["electrolyzer energy hourly [GW]"]) * 1.5],
+        ylim=[0, np.nanmax(df_e_usage["electrolyzer energy hourly [GW]"].to_numpy()) * 1.5],
+        rasterized=True,
     )
 
     ax[1, 0].legend(frameon=False)
@@ -230,7 +310,9 @@ def plot_energy_flows(
             "hydrogen storage SOC [kg]": "H$_2$ storage SOC [kt]",
         }
     )
-    df_h_out.plot(ax=ax[1, 1], ylabel="Hydrogen Produced (kt)", xlabel="Hour")
+    decimate(df_h_out).plot(
+        ax=ax[1, 1], ylabel="Hydrogen Produced (kt)", xlabel="Hour", rasterized=True
+    )
     ax[1, 1].legend(frameon=False)
 
     plt.tight_layout()
@@ -238,7 +320,8 @@ def plot_energy_flows(
     if save_fig:
         save_path = Path(save_path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(save_path, transparent=True)
+        with plt.rc_context({"agg.path.chunksize": AGG_PATH_CHUNKSIZE}):
+            plt.savefig(save_path, transparent=True)
     if show_fig:
         plt.show()
 
@@ -1,47 +1,55 @@
-import numpy as np
+from collections import deque
+
 import ProFAST
-import numpy_financial as npf
 
 
 def adjust_dollar_year(init_cost, init_dollar_year, adj_cost_year, costing_general_inflation):
     periods = adj_cost_year - init_dollar_year
-    adj_cost = -npf.fv(costing_general_inflation, periods, 0.0, init_cost)
+    # future value of a single present cost (no periodic payments)
+    adj_cost = init_cost * (1.0 + costing_general_inflation) ** periods
     return adj_cost
 
 
-def update_defaults(orig_dict, new_key, new_val):
-    for key, val in orig_dict.items():
-        if isinstance(val, dict):
-            # go deeper
-            tmp = update_defaults(orig_dict.get(key, {}), new_key, new_val)
-            orig_dict[key] = tmp
-        else:
-            if isinstance(key, list):
-                for i, k in enumerate(key):
-                    if k == new_key:
-                        orig_dict[k] = new_val
-                    else:
-                        orig_dict[k] = orig_dict.get(key, []) + val[i]
-            elif isinstance(key, str):
-                if key == new_key:
-                    orig_dict[key] = new_val
+def apply_defaults(orig_dict, updates):
+    """Replace the value of every matching key in a nested dictionary.
+
+    The dictionary is walked once, iteratively, and modified in place.
+
+    Args:
+        orig_dict (dict): (nested) dictionary to update.
+        updates (dict): new values keyed by the name of the key to replace.
+
+    Returns:
+        dict: the updated ``orig_dict``.
+    """
+    stack = deque([orig_dict])
+    while stack:
+        d = stack.popleft()
+        for key, val in d.items():
+            if isinstance(val, dict):
+                # go deeper
+                stack.append(val)
+            elif key in updates:
+                d[key] = updates[key]
     return orig_dict
 
 
+def update_defaults(orig_dict, new_key, new_val):
+    return apply_defaults(orig_dict, {new_key: new_val})
+
+
 def update_params_based_on_defaults(pf_config, update_config):
-    # TODO: update this
+    updates = {}
     if update_config["escalation"]["replace all"]:
-        escalation_val = update_config["escalation"]["escalation"]
-        pf_config = update_defaults(pf_config, "escalation", escalation_val)
+        updates["escalation"] = update_config["escalation"]["escalation"]
     if update_config["depreciation type"]["replace all"]:
-        depr_type = update_config["depreciation type"]["depr type"]
-        pf_config = update_defaults(pf_config, "depr_type", depr_type)
+        updates["depr_type"] = update_config["depreciation type"]["depr type"]
     if update_config["depreciation period"]["replace all"]:
-        depr_prd = update_config["depreciation period"]["period"]
-        pf_config = update_defaults(pf_config, "depr_period", depr_prd)
+        updates["depr_period"] = update_config["depreciation period"]["period"]
     if update_config["refurbishment period"]["replace all"]:
-        refurb_prd = update_config["refurbishment period"]["refurb"]
-        pf_config = update_defaults(pf_config, "refurb", refurb_prd)
+        updates["refurb"] = update_config["refurbishment period"]["refurb"]
+    if updates:
+        pf_config = apply_defaults(pf_config, updates)
     return pf_config
 
 
@@ -55,67 +63,38 @@ def create_and_populate_profast(pf_config):
         ProFAST object: profast object initialized with data from pf_config
     """
     pf = ProFAST.ProFAST()
-    config_keys = list(pf_config.keys())
+    config_keys = pf_config.keys()
     if "params" in config_keys:
         params = pf_config["params"]
         params["general inflation rate"]
-        for i in params:
-            pf.set_params(i, params[i])
+        set_params = pf.set_params
+        for name, value in params.items():
+            set_params(name, value)
 
     if "feedstocks" in config_keys:
-        variables = pf_config["feedstocks"]
-        for i in variables:
-            pf.add_feedstock(
-                i,
-                variables[i]["usage"],
-                variables[i]["unit"],
-                variables[i]["cost"],
-                variables[i]["escalation"],
-            )
+        add_feedstock = pf.add_feedstock
+        for name, v in pf_config["feedstocks"].items():
+            add_feedstock(name, v["usage"], v["unit"], v["cost"], v["escalation"])
 
     if "capital_items" in config_keys:
-        variables = pf_config["capital_items"]
-        for i in variables:
-            pf.add_capital_item(
-                i,
-                variables[i]["cost"],
-                variables[i]["depr_type"],
-                variables[i]["depr_period"],
-                variables[i]["refurb"],
-            )
+        add_capital_item = pf.add_capital_item
+        for name, v in pf_config["capital_items"].items():
+            add_capital_item(name, v["cost"], v["depr_type"], v["depr_period"], v["refurb"])
 
     if "fixed_costs" in config_keys:
-        variables = pf_config["fixed_costs"]
-        for i in variables:
-            pf.add_fixed_cost(
-                i,
-                variables[i]["usage"],
-                variables[i]["unit"],
-                variables[i]["cost"],
-                variables[i]["escalation"],
-            )
+        add_fixed_cost = pf.add_fixed_cost
+        for name, v in pf_config["fixed_costs"].items():
+            add_fixed_cost(name, v["usage"], v["unit"], v["cost"], v["escalation"])
 
     if "coproducts" in config_keys:
-        variables = pf_config["coproducts"]
-        for i in variables:
-            pf.add_coproduct(
-                i,
-                variables[i]["usage"],
-                variables[i]["unit"],
-                variables[i]["cost"],
-                variables[i]["escalation"],
-            )
+        add_coproduct = pf.add_coproduct
+        for name, v in pf_config["coproducts"].items():
+            add_coproduct(name, v["usage"], v["unit"], v["cost"], v["escalation"])
 
     if "incentives" in config_keys:
-        variables = pf_config["incentives"]
-        for i in variables:
-            pf.add_incentive(
-                i,
-                variables[i]["value"],
-                variables[i]["decay"],
-                variables[i]["sunset_years"],
-                variables[i]["tax_credit"],
-            )
+        add_incentive = pf.add_incentive
+        for name, v in pf_config["incentives"].items():
+            add_incentive(name, v["value"], v["decay"], v["sunset_years"], v["tax_credit"])
     return pf
 
 
@@ -161,80 +140,60 @@ def make_price_breakdown(price_breakdown, pf_config):
     full_price_breakdown = {}
     lco_str = "LCO{}".format(pf_config["params"]["commodity"]["name"][0])
     lco_units = "$/{}".format(pf_config["params"]["commodity"]["unit"])
-    config_keys = list(pf_config.keys())
+
+    # map each item name to its NPV once; keep the first entry if a name is repeated
+    npv_map = price_breakdown.drop_duplicates(subset="Name").set_index("Name")["NPV"].to_dict()
+
+    config_keys = pf_config.keys()
     if "capital_items" in config_keys:
         capital_items = pf_config["capital_items"]
         total_price_capex = 0
         capex_fraction = {}
         for item in capital_items:
-            total_price_capex += price_breakdown.loc[
-                price_breakdown["Name"] == item, "NPV"
-            ].tolist()[0]
+            total_price_capex += npv_map[item]
         for item in capital_items:
-            capex_fraction[item] = (
-                price_breakdown.loc[price_breakdown["Name"] == item, "NPV"].tolist()[0]
-                / total_price_capex
-            )
+            capex_fraction[item] = npv_map[item] / total_price_capex
     cap_expense = (
-        price_breakdown.loc[price_breakdown["Name"] == "Repayment of debt", "NPV"].tolist()[0]
-        + price_breakdown.loc[price_breakdown["Name"] == "Interest expense", "NPV"].tolist()[0]
-        + price_breakdown.loc[price_breakdown["Name"] == "Dividends paid", "NPV"].tolist()[0]
-        - price_breakdown.loc[price_breakdown["Name"] == "Inflow of debt", "NPV"].tolist()[0]
-        - price_breakdown.loc[price_breakdown["Name"] == "Inflow of equity", "NPV"].tolist()[0]
-        - price_breakdown.loc[
-            price_breakdown["Name"] == "One time capital incentive", "NPV"
-        ].tolist()[0]
+        npv_map["Repayment of debt"]
+        + npv_map["Interest expense"]
+        + npv_map["Dividends paid"]
+        - npv_map["Inflow of debt"]
+        - npv_map["Inflow of equity"]
+        - npv_map["One time capital incentive"]
     )
     remaining_financial = (
-        price_breakdown.loc[price_breakdown["Name"] == "Non-depreciable assets", "NPV"].tolist()[0]
-        + price_breakdown.loc[price_breakdown["Name"] == "Cash on hand reserve", "NPV"].tolist()[0]
-        + price_breakdown.loc[price_breakdown["Name"] == "Property insurance", "NPV"].tolist()[0]
-        - price_breakdown.loc[
-            price_breakdown["Name"] == "Sale of non-depreciable assets", "NPV"
-        ].tolist()[0]
-        - price_breakdown.loc[price_breakdown["Name"] == "Cash on hand recovery", "NPV"].tolist()[0]
+        npv_map["Non-depreciable assets"]
+        + npv_map["Cash on hand reserve"]
+        + npv_map["Property insurance"]
+        - npv_map["Sale of non-depreciable assets"]
+        - npv_map["Cash on hand recovery"]
     )
 
     if "capital_items" in config_keys:
         capital_items = pf_config["capital_items"]
         for item in capital_items:
             key_name = f"{lco_str}: {item} ({lco_units})"
-            price_breakdown_capex[key_name] = (
-                price_breakdown.loc[price_breakdown["Name"] == item, "NPV"].tolist()[0]
-                + cap_expense * capex_fraction[item]
-            )
+            price_breakdown_capex[key_name] = npv_map[item] + cap_expense * capex_fraction[item]
         full_price_breakdown.update(price_breakdown_capex)
 
     if "fixed_costs" in config_keys:
         fixed_items = pf_config["fixed_costs"]
         for item in fixed_items:
             key_name = f"{lco_str}: {item} ({lco_units})"
-            price_breakdown_fixed_cost[key_name] = price_breakdown.loc[
-                price_breakdown["Name"] == item, "NPV"
-            ].tolist()[0]
+            price_breakdown_fixed_cost[key_name] = npv_map[item]
         full_price_breakdown.update(price_breakdown_fixed_cost)
 
     if "feedstocks" in config_keys:
         feedstock_items = pf_config["feedstocks"]
         for item in feedstock_items:
             key_name = f"{lco_str}: {item} ({lco_units})"
-            price_breakdown_feedstocks[key_name] = price_breakdown.loc[
-                price_breakdown["Name"] == item, "NPV"
-            ].tolist()[0]
+            price_breakdown_feedstocks[key_name] = npv_map[item]
         full_price_breakdown.update(price_breakdown_feedstocks)
 
-    price_breakdown_taxes = (
-        price_breakdown.loc[price_breakdown["Name"] == "Income taxes payable", "NPV"].tolist()[0]
-        - price_breakdown.loc[price_breakdown["Name"] == "Monetized tax losses", "NPV"].tolist()[0]
-    )
+    price_breakdown_taxes = npv_map["Income taxes payable"] - npv_map["Monetized tax losses"]
 
     if pf_config["params"]["general inflation rate"] > 0:
-        price_breakdown_taxes = (
-            price_breakdown_taxes
-            + price_breakdown.loc[
-                price_breakdown["Name"] == "Capital gains taxes payable", "NPV"
-            ].tolist()[0]
-        )
+        price_breakdown_taxes = price_breakdown_taxes + npv_map["Capital gains taxes payable"]
 
     full_price_breakdown[f"{lco_str}: Taxes ({lco_units})"] = price_breakdown_taxes
     full_price_breakdown[f"{lco_str}: Finances ({lco_units})"] = remaining_financial
@@ -256,8 +215,8 @@ def create_years_of_operation(plant_life_years, analysis_start_year, installatio
         list[str]: list of years of operation.
     """
     operation_start_year = analysis_start_year + (installation_period_months / 12)
-    years_of_operation = np.arange(
-        int(operation_start_year), int(operation_start_year + plant_life_years), 1
+    years_of_operation = range(
+        int(operation_start_year), int(operation_start_year + plant_life_years)
     )
-    year_keys = [f"{y}" for y in years_of_operation]
+    year_keys = list(map(str, years_of_operation))
     return year_keys
@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 
@@ -22,5 +23,13 @@ class PipePerformanceModel(om.ExplicitComponent):
             units="kg/s",
         )
 
+    def setup_partials(self):
+        # the output is a copy of the input, so the Jacobian is a constant identity matrix
+        size = self._get_var_meta("hydrogen_input", "size")
+        arange = np.arange(size)
+        self.declare_partials(
+            "hydrogen_output", "hydrogen_input", rows=arange, cols=arange, val=1.0
+        )
+
     def compute(self, inputs, outputs):
         outputs["hydrogen_output"] = inputs["hydrogen_input"]
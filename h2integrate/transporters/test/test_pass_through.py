@@ -0,0 +1,47 @@
+import numpy as np
+import openmdao.api as om
+from pytest import approx
+from openmdao.utils.assert_utils import assert_check_partials
+
+from h2integrate.transporters.pipe import PipePerformanceModel
+from h2integrate.transporters.cable import CablePerformanceModel
+
+
+rng = np.random.default_rng(seed=0)
+
+
+def make_problem(transporter, commodity, units, n_timesteps):
+    prob = om.Problem()
+    ivc = om.IndepVarComp()
+    ivc.add_output(f"{commodity}_input", val=np.zeros(n_timesteps), units=units)
+    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
+    prob.model.add_subsystem("comp", transporter(), promotes=["*"])
+
+    prob.setup(force_alloc_complex=True)
+
+    return prob
+
+
+def test_pass_through_performance(subtests):
+    for transporter, commodity, units in (
+        (CablePerformanceModel, "electricity", "kW"),
+        (PipePerformanceModel, "hydrogen", "kg/s"),
+    ):
+        prob = make_problem(transporter, commodity, units, 8760)
+
+        commodity_input = rng.random(8760)
+        prob.set_val(f"{commodity}_input", commodity_input, units=units)
+        prob.run_model()
+
+        with subtests.test(f"{commodity} output"):
+            assert prob.get_val(f"{commodity}_output", units=units) == approx(commodity_input)
+
+        # the Jacobian is a diagonal of ones for any length, so a short series exercises it fully
+        # without a complex-step evaluation per hour of the year
+        prob = make_problem(transporter, commodity, units, 10)
+        prob.set_val(f"{commodity}_input", rng.random(10), units=units)
+        prob.run_model()
+
+        with subtests.test(f"{commodity} partials"):
+            partials = prob.check_partials(method="cs", out_stream=None)
+            assert_check_partials(partials)
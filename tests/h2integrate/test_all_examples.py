@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 
 import pytest
@@ -9,9 +8,9 @@ from h2integrate.core.h2integrate_model import H2IntegrateModel
 examples_dir = Path(__file__).resolve().parent.parent.parent / "examples/."
 
 
-def test_steel_example(subtests):
+def test_steel_example(subtests, monkeypatch):
     # Change the current working directory to the example's directory
-    os.chdir(examples_dir / "01_onshore_steel_mn")
+    monkeypatch.chdir(examples_dir / "01_onshore_steel_mn")
 
     # Create a H2Integrate model
     model = H2IntegrateModel(Path.cwd() / "01_onshore_steel_mn.yaml")
@@ -46,9 +45,9 @@ def test_steel_example(subtests):
         assert pytest.approx(model.prob.get_val("steel.OpEx"), rel=1e-3) == 1.0129052e08
 
 
-def test_ammonia_example(subtests):
+def test_ammonia_example(subtests, monkeypatch):
     # Change the current working directory to the example's directory
-    os.chdir(examples_dir / "02_texas_ammonia")
+    monkeypatch.chdir(examples_dir / "02_texas_ammonia")
 
     # Create a H2Integrate model
     model = H2IntegrateModel(Path.cwd() / "02_texas_ammonia.yaml")
@@ -0,0 +1,51 @@
+import copy
+from pathlib import Path
+
+import pytest
+from hopp.utilities import load_yaml
+
+from h2integrate.converters.hopp.hopp_mgmt import setup_hopp, overwrite_fin_values
+
+
+examples_dir = Path(__file__).resolve().parent.parent.parent / "examples/."
+
+
+def test_overwrite_fin_values(subtests):
+    hopp_config = {
+        "config": {"cost_info": {"wind_om_per_kw": 30.0, "pv_om_per_kw": 15.0}},
+        "technologies": {
+            "wind": {"fin_model": {"system_costs": {"om_capacity": [25.0, 25.0, 25.0]}}},
+            "pv": {"fin_model": {"system_costs": {"om_capacity": [15.0]}}},
+        },
+    }
+
+    with pytest.warns(UserWarning, match="'om_capacity' in the wind 'fin_model' was 25.0") as rec:
+        hopp_config = overwrite_fin_values(hopp_config)
+
+    technologies = hopp_config["technologies"]
+
+    with subtests.test("wind overwritten"):
+        assert technologies["wind"]["fin_model"]["system_costs"]["om_capacity"] == [30.0] * 3
+
+    with subtests.test("pv unchanged"):
+        assert technologies["pv"]["fin_model"]["system_costs"]["om_capacity"] == [15.0]
+
+    with subtests.test("one warning per value"):
+        assert len(rec) == 1
+
+    with subtests.test("no wind, pv, or battery"):
+        hopp_config = {"technologies": {"wave": {}, "grid": {"interconnect_kw": 100.0}}}
+        assert overwrite_fin_values(hopp_config) == hopp_config
+
+
+def test_setup_hopp_leaves_config_unchanged(monkeypatch):
+    # the resource and floris files are relative to the example directory
+    monkeypatch.chdir(examples_dir / "02_texas_ammonia")
+
+    # the fin_model values are not overwritten first, so HOPP applies cost_info to them itself
+    hopp_config = load_yaml("tech_inputs/hopp_config_tx.yaml")
+    original_config = copy.deepcopy(hopp_config)
+
+    setup_hopp(hopp_config, {}, electrolyzer_rating=640.0, overwrite_fin_model=False)
+
+    assert hopp_config == original_config
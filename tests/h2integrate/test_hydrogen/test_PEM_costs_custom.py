@@ -22,3 +22,10 @@ def test_custom_capex():
 def test_custom_fixed_om():
     capex, fom = calc_custom_electrolysis_capex_fom(electrolyzer_size_kW, elec_config)
     assert fom == approx(fom_usd_pr_kW * electrolyzer_size_kW, TOL)
+
+
+def test_custom_fixed_om_default():
+    capex, fom = calc_custom_electrolysis_capex_fom(
+        electrolyzer_size_kW, {"electrolyzer_capex": capex_usd_pr_kW}
+    )
+    assert fom == approx(0.0, TOL)
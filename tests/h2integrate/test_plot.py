@@ -0,0 +1,45 @@
+import os
+
+import numpy as np
+
+from h2integrate.tools.plot import downsample_indices, load_energy_flow_data
+
+
+rng = np.random.default_rng(seed=0)
+
+
+def test_downsample_indices(subtests):
+    with subtests.test("short series unchanged"):
+        assert np.array_equal(
+            downsample_indices(np.arange(100.0), target_points=100), np.arange(100)
+        )
+
+    for n_cols in (1, 4, 12):
+        data = rng.random((8760, n_cols))
+        idx = downsample_indices(data, target_points=500)
+
+        with subtests.test(f"{n_cols} columns bounded"):
+            assert len(idx) <= 2 * 500 + 2
+
+        with subtests.test(f"{n_cols} columns keep extremes"):
+            assert set(data.argmin(axis=0)) <= set(idx)
+            assert set(data.argmax(axis=0)) <= set(idx)
+            assert idx[0] == 0
+            assert idx[-1] == len(data) - 1
+
+
+def test_load_energy_flow_data(subtests, tmp_path):
+    fpath = tmp_path / "energy_flows.csv"
+    fpath.write_text(",a\n0,1.0\n1,2.0\n")
+
+    with subtests.test("reuses unmodified file"):
+        df = load_energy_flow_data(fpath)
+        assert df["a"].tolist() == [1.0, 2.0]
+        assert load_energy_flow_data(fpath) is df
+
+    with subtests.test("reloads modified file"):
+        stat = fpath.stat()
+        fpath.write_text(",a\n0,3.0\n1,4.0\n")
+        # a rewrite within the filesystem's timestamp resolution only changes the nanoseconds
+        os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_energy_flow_data(fpath)["a"].tolist() == [3.0, 4.0]
@@ -0,0 +1,100 @@
+import pandas as pd
+from pytest import approx
+
+from h2integrate.tools.profast_tools import (
+    adjust_dollar_year,
+    make_price_breakdown,
+    create_years_of_operation,
+    update_params_based_on_defaults,
+)
+
+
+def test_create_years_of_operation(subtests):
+    with subtests.test("whole-year installation"):
+        years = create_years_of_operation(3, 2030, 24)
+        assert years == ["2032", "2033", "2034"]
+
+    with subtests.test("partial-year installation"):
+        years = create_years_of_operation(30, 2028, 36 + 6)
+        assert len(years) == 30
+        assert years[0] == "2031"
+        assert years[-1] == "2060"
+
+
+def test_adjust_dollar_year():
+    adjusted = adjust_dollar_year(100.0, 2020, 2022, 0.025)
+    assert adjusted == approx(100.0 * 1.025**2)
+
+
+def test_update_params_based_on_defaults():
+    pf_config = {
+        "params": {"escalation": 0.0},
+        "capital_items": {
+            "A": {"cost": 1.0, "depr_type": "MACRS", "depr_period": 7, "refurb": [0]},
+            "B": {"cost": 2.0, "depr_type": "MACRS", "depr_period": 5, "refurb": [0]},
+        },
+        "fixed_costs": {"C": {"cost": 3.0, "escalation": 0.01}},
+    }
+    update_config = {
+        "escalation": {"replace all": True, "escalation": 0.03},
+        "depreciation type": {"replace all": False, "depr type": "Straight line"},
+        "depreciation period": {"replace all": True, "period": 10},
+        "refurbishment period": {"replace all": False, "refurb": [1]},
+    }
+
+    pf_config = update_params_based_on_defaults(pf_config, update_config)
+
+    assert pf_config["params"]["escalation"] == 0.03
+    assert pf_config["fixed_costs"]["C"]["escalation"] == 0.03
+    assert pf_config["capital_items"]["A"]["depr_period"] == 10
+    assert pf_config["capital_items"]["B"]["depr_period"] == 10
+    assert pf_config["capital_items"]["A"]["depr_type"] == "MACRS"
+    assert pf_config["capital_items"]["B"]["refurb"] == [0]
+
+
+def test_make_price_breakdown():
+    npvs = {
+        "Electrolyzer": 2.0,
+        "Storage": 1.0,
+        "Electrolyzer O&M": 0.5,
+        "Water": 0.1,
+        "Repayment of debt": 0.6,
+        "Interest expense": 0.3,
+        "Dividends paid": 0.3,
+        "Inflow of debt": 0.0,
+        "Inflow of equity": 0.0,
+        "One time capital incentive": 0.0,
+        "Non-depreciable assets": 0.0,
+        "Cash on hand reserve": 0.2,
+        "Property insurance": 0.1,
+        "Sale of non-depreciable assets": 0.0,
+        "Cash on hand recovery": 0.1,
+        "Income taxes payable": 0.4,
+        "Monetized tax losses": 0.1,
+        "Capital gains taxes payable": 0.05,
+    }
+    price_breakdown = pd.DataFrame({"Name": list(npvs), "NPV": list(npvs.values())})
+    # a repeated name should not override the first entry
+    price_breakdown.loc[len(price_breakdown)] = ["Electrolyzer", 100.0]
+
+    pf_config = {
+        "params": {
+            "commodity": {"name": "Hydrogen", "unit": "kg"},
+            "general inflation rate": 0.0,
+        },
+        "capital_items": {"Electrolyzer": {}, "Storage": {}},
+        "fixed_costs": {"Electrolyzer O&M": {}},
+        "feedstocks": {"Water": {}},
+    }
+
+    breakdown, lco_check = make_price_breakdown(price_breakdown, pf_config)
+
+    # debt and dividends are distributed over the capital items by capex fraction
+    assert breakdown["LCOH: Electrolyzer ($/kg)"] == approx(2.0 + 1.2 * 2.0 / 3.0)
+    assert breakdown["LCOH: Storage ($/kg)"] == approx(1.0 + 1.2 * 1.0 / 3.0)
+    assert breakdown["LCOH: Electrolyzer O&M ($/kg)"] == approx(0.5)
+    assert breakdown["LCOH: Water ($/kg)"] == approx(0.1)
+    assert breakdown["LCOH: Taxes ($/kg)"] == approx(0.3)
+    assert breakdown["LCOH: Finances ($/kg)"] == approx(0.2)
+    assert lco_check == approx(3.0 + 1.2 + 0.5 + 0.1 + 0.3 + 0.2)
+    assert breakdown["LCOH: Total ($/kg)"] == approx(lco_check)